@@ -6,13 +6,29 @@ Kindle for PC ウィンドウ管理モジュール
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import time
-import pygetwindow as gw
 from loguru import logger
 
+# pygetwindow は初回使用時に読み込む（_get_gw を参照）
+gw = None
 
-@dataclass
+
+def _get_gw():
+    """
+    pygetwindow を遅延インポートして返す
+
+    Returns:
+        pygetwindow モジュール
+    """
+    global gw
+    if gw is None:
+        import pygetwindow
+        gw = pygetwindow
+    return gw
+
+
+@dataclass(slots=True)
 class WindowInfo:
     """ウィンドウ情報を保持するデータクラス"""
     title: str
@@ -20,10 +36,10 @@ class WindowInfo:
     top: int
     width: int
     height: int
-    handle: Optional[object] = None
+    handle: Optional[object] = None  # ウィンドウハンドル（hwnd）
 
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     """画面領域を表すデータクラス"""
     left: int
@@ -43,15 +59,33 @@ class WindowManager:
     # Kindle for PCのウィンドウタイトルに含まれるキーワード
     KINDLE_KEYWORDS = ["kindle", "Kindle"]
 
-    def __init__(self, window_title_pattern: Optional[str] = None):
+    def __init__(
+        self,
+        window_title_pattern: Optional[str] = None,
+        cache_ttl: float = 0.1
+    ):
         """
         WindowManagerの初期化
 
         Args:
             window_title_pattern: ウィンドウタイトルのパターン（オプション）
                                  指定しない場合はデフォルトのKindleキーワードを使用
+            cache_ttl: ウィンドウ一覧をキャッシュする秒数（0 でキャッシュ無効）
         """
         self.window_title_pattern = window_title_pattern
+        self.cache_ttl = cache_ttl
+
+        # タイトル照合用のキーワードを事前に準備する
+        # カスタムパターンは大文字小文字を区別せずに照合する
+        if window_title_pattern:
+            self._title_keywords: Tuple[str, ...] = (window_title_pattern.lower(),)
+            self._ignore_case = True
+        else:
+            self._title_keywords = tuple(dict.fromkeys(self.KINDLE_KEYWORDS))
+            self._ignore_case = False
+
+        self._cache = None
+        self._cache_ts = 0.0
         logger.info("WindowManager initialized")
 
     def find_kindle_window(self) -> Optional[WindowInfo]:
@@ -66,22 +100,13 @@ class WindowManager:
         """
         try:
             logger.debug("Searching for Kindle window...")
-            all_windows = gw.getAllWindows()
-
-            # カスタムパターンが指定されている場合はそれを使用
-            if self.window_title_pattern:
-                for window in all_windows:
-                    if self.window_title_pattern.lower() in window.title.lower():
-                        window_info = self._create_window_info(window)
-                        logger.info(f"Kindle window found: {window_info.title}")
-                        return window_info
-            else:
-                # デフォルトのKindleキーワードで検索
-                for window in all_windows:
-                    if any(keyword in window.title for keyword in self.KINDLE_KEYWORDS):
-                        window_info = self._create_window_info(window)
-                        logger.info(f"Kindle window found: {window_info.title}")
-                        return window_info
+            all_windows = self._all_windows()
+
+            # カスタムパターン、またはデフォルトのKindleキーワードで検索
+            for window_info in all_windows:
+                if self._match_title(window_info.title):
+                    logger.info(f"Kindle window found: {window_info.title}")
+                    return window_info
 
             logger.warning("Kindle window not found")
             return None
@@ -107,8 +132,11 @@ class WindowManager:
 
             logger.debug(f"Activating window: {window_info.title}")
 
-            # ウィンドウハンドルを取得
-            hwnd = win32gui.FindWindow(None, window_info.title)
+            # ウィンドウハンドルを取得（検出時に取得済みであれば再検索しない）
+            if window_info.handle is not None:
+                hwnd = window_info.handle
+            else:
+                hwnd = win32gui.FindWindow(None, window_info.title)
             if not hwnd:
                 logger.error(f"Window handle not found: {window_info.title}")
                 return False
@@ -118,7 +146,10 @@ class WindowManager:
             for attempt in range(max_retries):
                 # 方法1: pygetwindow
                 try:
-                    windows = gw.getWindowsWithTitle(window_info.title)
+                    if window_info.handle is not None:
+                        windows = [_get_gw().Win32Window(hwnd)]
+                    else:
+                        windows = _get_gw().getWindowsWithTitle(window_info.title)
                     if windows:
                         target_window = windows[0]
                         if target_window.isMinimized:
@@ -279,13 +310,12 @@ class WindowManager:
         """
         try:
             logger.debug("Listing all windows...")
-            all_windows = gw.getAllWindows()
-
-            window_list = []
-            for window in all_windows:
-                if window.title:  # タイトルが空でないウィンドウのみ
-                    window_info = self._create_window_info(window)
-                    window_list.append(window_info)
+            # タイトルが空でないウィンドウのみ
+            window_list = [
+                window_info
+                for window_info in self._all_windows()
+                if window_info.title
+            ]
 
             logger.info(f"Found {len(window_list)} windows")
             return window_list
@@ -294,24 +324,67 @@ class WindowManager:
             logger.error(f"Error while listing windows: {e}")
             return []
 
-    def _create_window_info(self, window) -> WindowInfo:
+    def _match_title(self, title: str) -> bool:
         """
-        pygetwindowのWindowオブジェクトからWindowInfoを作成する
+        ウィンドウタイトルが検索キーワードのいずれかを含むか判定する
 
         Args:
-            window: pygetwindowのWindowオブジェクト
+            title: ウィンドウタイトル
 
         Returns:
-            WindowInfo: ウィンドウ情報
+            bool: いずれかのキーワードを含む場合はTrue
         """
-        return WindowInfo(
-            title=window.title,
-            left=window.left,
-            top=window.top,
-            width=window.width,
-            height=window.height,
-            handle=window
-        )
+        if self._ignore_case:
+            title = title.lower()
+        return any(keyword in title for keyword in self._title_keywords)
+
+    def _all_windows(self) -> List[WindowInfo]:
+        """
+        すべてのウィンドウを取得する
+
+        直前の取得から cache_ttl 秒以内であれば、前回の結果を返す。
+
+        Returns:
+            List[WindowInfo]: 表示中のすべてのウィンドウ情報のリスト
+        """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self.cache_ttl:
+            return self._cache
+
+        self._cache = _enum_windows()
+        self._cache_ts = now
+        return self._cache
+
+
+def _enum_windows() -> List[WindowInfo]:
+    """
+    win32gui.EnumWindows で表示中のトップレベルウィンドウを列挙する
+
+    pygetwindow.getAllWindows() はプロパティ参照のたびにWin32 APIを呼び出すため、
+    タイトルと矩形をウィンドウごとに1回だけ取得してWindowInfoを作成する。
+
+    Returns:
+        List[WindowInfo]: ウィンドウ情報のリスト（handleはウィンドウハンドル）
+    """
+    import win32gui
+
+    windows: List[WindowInfo] = []
+
+    def callback(hwnd, _):
+        if win32gui.IsWindowVisible(hwnd):
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            windows.append(WindowInfo(
+                title=win32gui.GetWindowText(hwnd),
+                left=left,
+                top=top,
+                width=right - left,
+                height=bottom - top,
+                handle=hwnd
+            ))
+        return True
+
+    win32gui.EnumWindows(callback, None)
+    return windows
 
 
 # 使用例とテスト用のヘルパー関数
@@ -5,13 +5,55 @@
 スクリーンショット画像に対して各種前処理を行います。
 """
 
-from typing import Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
 import cv2
 import numpy as np
+import PIL
 from PIL import Image, ImageFilter
 from loguru import logger
 
 
+# Pillow-SIMD はバージョン文字列に ".post" が付く（例: 9.5.0.post1）
+PILLOW_SIMD = ".post" in PIL.__version__
+logger.debug(f"Pillow {PIL.__version__} (SIMD build: {PILLOW_SIMD})")
+
+
+# process_batch のワーカープロセスごとに保持する ImageProcessor
+_batch_processor: Optional["ImageProcessor"] = None
+
+
+def _init_batch_worker(config: dict, enable_flags: dict) -> None:
+    """
+    process_batch のワーカープロセスを初期化する
+
+    Args:
+        config: 親プロセスの ImageProcessor が保持する設定辞書
+        enable_flags: 各処理の有効/無効フラグ
+    """
+    global _batch_processor
+    _batch_processor = ImageProcessor(config=config, **enable_flags)
+
+
+def _process_batch_item(image_path: str, output_path: str) -> str:
+    """
+    ワーカープロセスで1枚の画像を最適化して保存する
+
+    Args:
+        image_path: 入力画像のパス
+        output_path: 出力画像のパス
+
+    Returns:
+        str: 出力画像のパス
+    """
+    with Image.open(image_path) as image:
+        result = _batch_processor.optimize_for_ocr(image)
+    result.save(output_path)
+    return output_path
+
+
 class ImageProcessor:
     """
     画像前処理を行うクラス
@@ -52,6 +94,17 @@ class ImageProcessor:
             self.enable_binarization = enable_binarization if enable_binarization is not None else True
             self.config = {}
 
+        # 余白トリミングの閾値はページごとに参照されるため、初期化時に解決しておく
+        margin_trim_config = self.config.get("margin_trim", {})
+        self._margin_threshold = margin_trim_config.get("threshold", 240)
+        self._dark_threshold = margin_trim_config.get("dark_threshold", 50)
+
+        # 拡大処理のバックエンド（"pil" または "cv2"）
+        self._upscale_backend = self.config.get("upscaling", {}).get("backend", "pil")
+
+        # シャープ化処理のバックエンド（"pil" または "cv2"）
+        self._sharpen_backend = self.config.get("sharpening", {}).get("backend", "pil")
+
         logger.info(
             f"ImageProcessor initialized: "
             f"noise_removal={self.enable_noise_removal}, "
@@ -264,8 +317,8 @@ class ImageProcessor:
     def trim_margins(
         self,
         image: Image.Image,
-        margin_threshold: int = 240,
-        dark_threshold: int = 50
+        margin_threshold: Optional[int] = None,
+        dark_threshold: Optional[int] = None
     ) -> Image.Image:
         """
         画像の余白をトリミングする（白い余白と黒い余白の両方に対応）
@@ -273,20 +326,26 @@ class ImageProcessor:
         Args:
             image: 入力画像
             margin_threshold: 白い余白と判定する輝度の閾値（0-255）
+                              Noneの場合は設定値（デフォルト: 240）を使用
             dark_threshold: 黒い余白と判定する輝度の閾値（0-255）
+                            Noneの場合は設定値（デフォルト: 50）を使用
 
         Returns:
             Image.Image: トリミング後の画像
         """
+        if margin_threshold is None:
+            margin_threshold = self._margin_threshold
+        if dark_threshold is None:
+            dark_threshold = self._dark_threshold
+
         try:
             logger.debug(f"Trimming margins: white_threshold={margin_threshold}, dark_threshold={dark_threshold}")
 
-            # PIL ImageをOpenCV形式に変換
-            cv2_image = self.pil_to_cv2(image)
-            img_height, img_width = cv2_image.shape[:2]
-
-            # グレースケールに変換
-            gray = cv2.cvtColor(cv2_image, cv2.COLOR_BGR2GRAY)
+            # 余白の検出には輝度のみを使うため、最初にグレースケールへ変換する
+            # （3チャンネルのBGRコピーを作らない）
+            gray_image = image if image.mode == "L" else image.convert("L")
+            gray = np.asarray(gray_image)
+            img_height, img_width = gray.shape[:2]
 
             # 明るい領域（白い背景＝ページコンテンツ領域）を検出
             # 閾値以上の輝度を持つ領域を白色ページとみなす
@@ -326,11 +385,10 @@ class ImageProcessor:
                 logger.debug("Trimming area too small, skipping")
                 return image
 
-            # トリミング
-            cropped = cv2_image[y_start:y_end, x_start:x_end]
-
-            # PIL Imageに戻す
-            result = self.cv2_to_pil(cropped)
+            # 検出した範囲で元の画像をトリミング
+            result = image.crop((x_start, y_start, x_end, y_end))
+            if result.mode != "RGB":
+                result = result.convert("RGB")
 
             width_reduction = img_width - new_width
             height_reduction = img_height - new_height
@@ -353,6 +411,9 @@ class ImageProcessor:
         """
         画像を高解像度化する
 
+        設定の upscaling.backend が "cv2" の場合は OpenCV の resize を使用し、
+        それ以外の場合は PIL の resize を使用する。
+
         Args:
             image: 入力画像
             scale_factor: 拡大倍率（1.5, 2.0, 2.5など）
@@ -371,6 +432,9 @@ class ImageProcessor:
             new_width = int(width * scale_factor)
             new_height = int(height * scale_factor)
 
+            if self._upscale_backend == "cv2":
+                return self._upscale_image_cv2(image, new_width, new_height, interpolation)
+
             # 補間方法を選択
             interpolation_methods = {
                 "lanczos": Image.Resampling.LANCZOS,
@@ -394,6 +458,51 @@ class ImageProcessor:
             logger.error(f"Error in image upscaling: {e}")
             return image
 
+    def _upscale_image_cv2(
+        self,
+        image: Image.Image,
+        new_width: int,
+        new_height: int,
+        interpolation: str
+    ) -> Image.Image:
+        """
+        OpenCVのresizeで画像を拡大する（SIMD最適化された補間処理を使用）
+
+        Args:
+            image: 入力画像
+            new_width: 拡大後の幅
+            new_height: 拡大後の高さ
+            interpolation: 補間方法（lanczos, bicubic, bilinear, nearest）
+
+        Returns:
+            Image.Image: 拡大後の画像
+        """
+        interpolation_methods = {
+            "lanczos": cv2.INTER_LANCZOS4,
+            "bicubic": cv2.INTER_CUBIC,
+            "bilinear": cv2.INTER_LINEAR,
+            "nearest": cv2.INTER_NEAREST
+        }
+
+        flag = interpolation_methods.get(
+            interpolation.lower(),
+            cv2.INTER_LANCZOS4  # デフォルトはLANCZOS
+        )
+
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGB")
+
+        # 補間はチャンネルごとに独立して行われるため、RGB/RGBAのまま処理できる
+        # （PILのresizeと同様にアルファチャンネルを保持する）
+        upscaled = cv2.resize(
+            np.asarray(image),
+            (new_width, new_height),
+            interpolation=flag
+        )
+
+        logger.debug(f"Image upscaled with cv2 to {new_width}x{new_height}")
+        return Image.fromarray(upscaled)
+
     def sharpen_image(
         self,
         image: Image.Image,
@@ -404,6 +513,9 @@ class ImageProcessor:
         """
         画像をシャープ化する（アンシャープマスク）
 
+        設定の sharpening.backend が "cv2" の場合は OpenCV で処理し、
+        それ以外の場合は PIL の UnsharpMask を使用する。
+
         Args:
             image: 入力画像
             radius: ぼかしの半径（1-3推奨）
@@ -416,6 +528,9 @@ class ImageProcessor:
         try:
             logger.debug(f"Sharpening image: radius={radius}, percent={percent}, threshold={threshold}")
 
+            if self._sharpen_backend == "cv2":
+                return self._sharpen_image_cv2(image, radius, percent, threshold)
+
             # アンシャープマスクフィルタを適用
             sharpened = image.filter(
                 ImageFilter.UnsharpMask(
@@ -432,6 +547,48 @@ class ImageProcessor:
             logger.error(f"Error in image sharpening: {e}")
             return image
 
+    def _sharpen_image_cv2(
+        self,
+        image: Image.Image,
+        radius: float,
+        percent: int,
+        threshold: int
+    ) -> Image.Image:
+        """
+        OpenCVでアンシャープマスクを適用する
+
+        ぼかし画像のバッファを出力先として再利用する（threshold 判定用の
+        差分配列とマスクは別途確保する）。
+        PILのUnsharpMaskと同様に、元画像との差が threshold 以下の画素は変更せず、
+        RGBA画像はアルファチャンネルを保持したまま処理する。
+
+        Args:
+            image: 入力画像
+            radius: ぼかしの半径（ガウシアンのシグマ）
+            percent: 強調の程度（%）
+            threshold: 適用する最小輝度差
+
+        Returns:
+            Image.Image: シャープ化後の画像
+        """
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGB")
+
+        original = np.asarray(image)
+        amount = percent / 100.0
+
+        blurred = cv2.GaussianBlur(original, (0, 0), sigmaX=radius)
+
+        # 差が小さい画素（平坦な領域）はシャープ化の対象外
+        low_contrast = cv2.absdiff(original, blurred) <= threshold
+
+        # original + amount * (original - blurred) をぼかし画像のバッファに書き込む
+        cv2.addWeighted(original, 1.0 + amount, blurred, -amount, 0, dst=blurred)
+        np.copyto(blurred, original, where=low_contrast)
+
+        logger.debug("Image sharpening completed (cv2)")
+        return Image.fromarray(blurred)
+
     def binarize(
         self,
         image: Image.Image,
@@ -573,8 +730,8 @@ class ImageProcessor:
                 enable_trimming = margin_trim_config.get("enabled", True)
 
             if enable_trimming:
-                margin_threshold = settings.get("margin_threshold") or margin_trim_config.get("threshold", 240)
-                dark_threshold = settings.get("dark_threshold") or margin_trim_config.get("dark_threshold", 50)
+                margin_threshold = settings.get("margin_threshold") or self._margin_threshold
+                dark_threshold = settings.get("dark_threshold") or self._dark_threshold
                 result = self.trim_margins(result, margin_threshold=margin_threshold, dark_threshold=dark_threshold)
 
             # 7. 二値化
@@ -593,6 +750,106 @@ class ImageProcessor:
             logger.error(f"Error in OCR optimization: {e}")
             return image
 
+    def process_batch(
+        self,
+        image_paths: List[Path],
+        output_dir: Path,
+        max_workers: Optional[int] = None
+    ) -> dict:
+        """
+        複数の画像を並列にOCR用最適化して保存する
+
+        各ページの前処理は独立しているため、ProcessPoolExecutor で
+        ワーカープロセスに分散して処理します。
+
+        Args:
+            image_paths: 入力画像のパスのリスト
+            output_dir: 出力ディレクトリ（入力と同じファイル名で保存）
+                        いずれかの入力画像を上書きする場合や、ファイル名が
+                        （大文字小文字を区別せずに）重複する場合は
+                        その画像を処理せずに失敗として扱います
+            max_workers: ワーカープロセス数（Noneの場合はCPUコア数）
+
+        Returns:
+            dict: 処理結果
+                - success_count: 成功した画像数
+                - output_files: 保存された画像のパスのリスト（入力順）
+                - failed_files: 失敗した入力画像のパスのリスト（入力順）
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Starting batch optimization: {len(image_paths)} images")
+
+        enable_flags = {
+            "enable_noise_removal": self.enable_noise_removal,
+            "enable_contrast_adjustment": self.enable_contrast_adjustment,
+            "enable_skew_correction": self.enable_skew_correction,
+            "enable_binarization": self.enable_binarization,
+        }
+
+        outputs = {}
+        failed_files = []
+
+        image_paths = [Path(image_path) for image_path in image_paths]
+
+        # 出力先がいずれかの入力画像、または他の入力と同じファイルになるものは処理しない
+        # （Windowsではファイル名の大文字小文字を区別しないため、正規化して比較する）
+        input_files = {
+            os.path.normcase(str(image_path.resolve())) for image_path in image_paths
+        }
+        targets = {}
+        output_names = set()
+        for index, image_path in enumerate(image_paths):
+            output_path = output_dir / image_path.name
+            output_name = image_path.name.lower()
+            if os.path.normcase(str(output_path.resolve())) in input_files:
+                logger.error(f"Output would overwrite an input image: {output_path}")
+                failed_files.append((index, image_path))
+            elif output_name in output_names:
+                logger.error(f"Duplicate output file name in batch: {image_path}")
+                failed_files.append((index, image_path))
+            else:
+                output_names.add(output_name)
+                targets[index] = (image_path, output_path)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(self.config, enable_flags)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _process_batch_item,
+                    str(image_path),
+                    str(output_path)
+                ): index
+                for index, (image_path, output_path) in targets.items()
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    outputs[index] = Path(future.result())
+                except Exception as e:
+                    logger.error(f"Error in batch optimization for {image_paths[index]}: {e}")
+                    failed_files.append((index, image_paths[index]))
+
+        # 結果は完了順ではなく入力順に並べる
+        output_files = [outputs[index] for index in sorted(outputs)]
+        failed_files = [image_path for _, image_path in sorted(failed_files)]
+
+        logger.info(
+            f"Batch optimization completed: "
+            f"{len(output_files)}/{len(image_paths)} images successful"
+        )
+
+        return {
+            "success_count": len(output_files),
+            "output_files": output_files,
+            "failed_files": failed_files
+        }
+
 
 # 使用例とヘルパー関数
 def quick_optimize(
@@ -5,15 +5,59 @@
 """
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from loguru import logger
 
 
-@dataclass
+def _compress_pages(pages: List[int]) -> List[List[int]]:
+    """
+    ページ番号のリストを連続区間 [start, end] のリストに圧縮
+
+    連続して増加するページ番号をひとつの区間にまとめます。
+    元の並び順は保持されるため、_expand_pages で同じリストに戻せます。
+
+    Args:
+        pages: ページ番号のリスト
+
+    Returns:
+        [開始ページ, 終了ページ] のリスト
+    """
+    ranges: List[List[int]] = []
+    for page in pages:
+        if ranges and page == ranges[-1][1] + 1:
+            ranges[-1][1] = page
+        else:
+            ranges.append([page, page])
+    return ranges
+
+
+def _expand_pages(pages: List[Union[int, List[int]]]) -> List[int]:
+    """
+    圧縮されたページ区間をページ番号のリストに展開
+
+    旧形式（ページ番号をそのまま並べたリスト）もそのまま受け付けます。
+
+    Args:
+        pages: [開始ページ, 終了ページ] またはページ番号のリスト
+
+    Returns:
+        ページ番号のリスト
+    """
+    expanded: List[int] = []
+    for item in pages:
+        if isinstance(item, list):
+            start, end = item
+            expanded.extend(range(start, end + 1))
+        else:
+            expanded.append(item)
+    return expanded
+
+
+@dataclass(slots=True)
 class StateData:
     """処理状態データクラス"""
 
@@ -30,12 +74,36 @@ class StateData:
 
     def to_dict(self) -> dict:
         """辞書形式に変換"""
-        return asdict(self)
+        # asdict() は再帰的に deepcopy するため、フィールドを直接列挙する
+        return {
+            "book_title": self.book_title,
+            "start_datetime": self.start_datetime,
+            "last_update": self.last_update,
+            "current_page": self.current_page,
+            "total_pages": self.total_pages,
+            "processed_pages": list(self.processed_pages),
+            "failed_pages": list(self.failed_pages),
+            "output_file": self.output_file,
+            "screenshot_dir": self.screenshot_dir,
+            "status": self.status,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "StateData":
         """辞書から StateData を作成"""
-        return cls(**data)
+        # フィールドを明示的に取り出し、キーの欠落は KeyError として検出する
+        return cls(
+            book_title=data["book_title"],
+            start_datetime=data["start_datetime"],
+            last_update=data["last_update"],
+            current_page=data["current_page"],
+            total_pages=data["total_pages"],
+            processed_pages=_expand_pages(data["processed_pages"]),
+            failed_pages=_expand_pages(data["failed_pages"]),
+            output_file=data["output_file"],
+            screenshot_dir=data["screenshot_dir"],
+            status=data["status"],
+        )
 
 
 class StateManager:
@@ -85,8 +153,12 @@ class StateManager:
         """
         try:
             file_path = self.get_state_file_path(state.book_title)
+            data = state.to_dict()
+            # ページ番号は連続区間に圧縮して保存する（from_dict で展開）
+            data["processed_pages"] = _compress_pages(state.processed_pages)
+            data["failed_pages"] = _compress_pages(state.failed_pages)
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(state.to_dict(), f, ensure_ascii=False, indent=2)
+                json.dump(data, f, ensure_ascii=False, indent=2)
             logger.info(f"State saved successfully: {file_path}")
             return True
         except Exception as e:
@@ -0,0 +1,98 @@
+"""
+テスト全体で共有するフィクスチャ
+
+config/config.yaml の解析結果を pickle でキャッシュし、
+YAMLの解析をテスト実行ごとに繰り返さないようにする。
+また、実スクリーンショットを使うテストが参照する画像のパスを一か所で定義し、
+デコードは要求された場合にのみセッション中1回だけ行う。
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+import pytest
+import yaml
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONFIG_PATH = PROJECT_ROOT / "config" / "config.yaml"
+CONFIG_CACHE_PATH = Path(__file__).parent / ".config.pkl"
+SCREENSHOT_PATH = PROJECT_ROOT / "output" / "LLM自作入門_screenshots" / "page_0002.png"
+
+
+def _load_config() -> Optional[dict]:
+    """
+    設定ファイルを読み込む
+
+    キャッシュが config.yaml より新しい場合は pickle から読み込み、
+    そうでない場合は YAML を解析してキャッシュを更新する。
+
+    Returns:
+        設定辞書。config.yaml が存在しない場合は None
+    """
+    if not CONFIG_PATH.exists():
+        return None
+
+    if (
+        CONFIG_CACHE_PATH.exists()
+        and CONFIG_CACHE_PATH.stat().st_mtime >= CONFIG_PATH.stat().st_mtime
+    ):
+        return pickle.loads(CONFIG_CACHE_PATH.read_bytes())
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = yaml.load(f, Loader=loader)
+
+    # pytest-xdist の複数ワーカーが同時に書き込んでも壊れないよう、
+    # 一時ファイルに書き込んでから置き換える
+    tmp_path = CONFIG_CACHE_PATH.with_name(f"{CONFIG_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(pickle.dumps(config, pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, CONFIG_CACHE_PATH)
+    except OSError:
+        # キャッシュを書き込めない環境でもテストは継続する
+        pass
+
+    return config
+
+
+CONFIG = _load_config()
+
+
+@pytest.fixture(scope="session")
+def config():
+    """設定ファイルの内容（読み取り専用として共有）"""
+    if CONFIG is None:
+        pytest.skip(f"Config file not found: {CONFIG_PATH}")
+    return CONFIG
+
+
+@pytest.fixture(scope="session")
+def screenshot_path() -> Optional[Path]:
+    """実スクリーンショットのパス。ファイルが存在しない場合は None"""
+    if SCREENSHOT_PATH.exists():
+        return SCREENSHOT_PATH
+    return None
+
+
+@pytest.fixture(scope="session")
+def screenshot_array(screenshot_path):
+    """
+    デコード済みスクリーンショットのピクセル配列（読み取り専用）
+
+    要求したテストが選択された場合のみ、セッション中1回だけデコードする。
+    スクリーンショットが存在しない場合は None
+    """
+    if screenshot_path is None:
+        return None
+
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(screenshot_path) as image:
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        array = np.asarray(image)
+    array.flags.writeable = False
+    return array
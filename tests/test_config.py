@@ -1,8 +1,5 @@
 """Unit tests for config module."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
@@ -26,13 +23,12 @@ class TestConfigLoader:
         }
 
     @pytest.fixture
-    def config_file(self, sample_config):
+    def config_file(self, sample_config, tmp_path):
         """Create temporary configuration file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False, encoding="utf-8"
-        ) as f:
+        path = tmp_path / "config.yaml"
+        with open(path, "w", encoding="utf-8") as f:
             yaml.dump(sample_config, f)
-            return Path(f.name)
+        return path
 
     def test_load_config_success(self, config_file, sample_config):
         """Test successful configuration loading."""
@@ -42,9 +38,6 @@ class TestConfigLoader:
         assert config == sample_config
         assert config["kindle"]["window_title"] == "Kindle"
 
-        # Cleanup
-        config_file.unlink()
-
     def test_load_config_file_not_found(self):
         """Test loading non-existent configuration file."""
         with pytest.raises(FileNotFoundError):
@@ -57,9 +50,6 @@ class TestConfigLoader:
 
         assert loader.get("logging") == {"level": "DEBUG"}
 
-        # Cleanup
-        config_file.unlink()
-
     def test_get_value_dot_notation(self, config_file):
         """Test getting value with dot notation."""
         loader = ConfigLoader(str(config_file))
@@ -68,9 +58,6 @@ class TestConfigLoader:
         assert loader.get("kindle.window_title") == "Kindle"
         assert loader.get("ocr.yomitoku.confidence_threshold") == 0.7
 
-        # Cleanup
-        config_file.unlink()
-
     def test_get_value_with_default(self, config_file):
         """Test getting non-existent value with default."""
         loader = ConfigLoader(str(config_file))
@@ -79,9 +66,6 @@ class TestConfigLoader:
         assert loader.get("nonexistent", "default") == "default"
         assert loader.get("kindle.nonexistent", 123) == 123
 
-        # Cleanup
-        config_file.unlink()
-
     def test_get_section(self, config_file):
         """Test getting configuration section."""
         loader = ConfigLoader(str(config_file))
@@ -91,9 +75,6 @@ class TestConfigLoader:
         assert kindle_config["window_title"] == "Kindle"
         assert kindle_config["page_turn_key"] == "Right"
 
-        # Cleanup
-        config_file.unlink()
-
     def test_get_section_not_found(self, config_file):
         """Test getting non-existent section."""
         loader = ConfigLoader(str(config_file))
@@ -102,9 +83,6 @@ class TestConfigLoader:
         with pytest.raises(KeyError):
             loader.get_section("nonexistent")
 
-        # Cleanup
-        config_file.unlink()
-
     def test_validate_required_keys_success(self, config_file):
         """Test validation with all required keys present."""
         loader = ConfigLoader(str(config_file))
@@ -113,9 +91,6 @@ class TestConfigLoader:
         required = ["kindle.window_title", "ocr.primary_engine", "logging.level"]
         assert loader.validate_required_keys(required) is True
 
-        # Cleanup
-        config_file.unlink()
-
     def test_validate_required_keys_missing(self, config_file):
         """Test validation with missing required keys."""
         loader = ConfigLoader(str(config_file))
@@ -125,9 +100,6 @@ class TestConfigLoader:
         with pytest.raises(ValueError, match="Missing required configuration keys"):
             loader.validate_required_keys(required)
 
-        # Cleanup
-        config_file.unlink()
-
     def test_reload_config(self, config_file, sample_config):
         """Test reloading configuration."""
         loader = ConfigLoader(str(config_file))
@@ -141,9 +113,6 @@ class TestConfigLoader:
         config2 = loader.reload()
         assert config2["logging"]["level"] == "INFO"
 
-        # Cleanup
-        config_file.unlink()
-
     def test_config_property(self, config_file):
         """Test config property."""
         loader = ConfigLoader(str(config_file))
@@ -153,9 +122,6 @@ class TestConfigLoader:
         assert config is not None
         assert "kindle" in config
 
-        # Cleanup
-        config_file.unlink()
-
 
 class TestSettings:
     """Test cases for Settings class."""
@@ -38,6 +38,18 @@ class TestImageProcessor:
         assert processor.enable_skew_correction is False
         assert processor.enable_binarization is False
 
+    def test_init_margin_trim_thresholds(self):
+        """余白トリミング閾値の設定読み込みテスト"""
+        processor = ImageProcessor(
+            config={"margin_trim": {"threshold": 230, "dark_threshold": 40}}
+        )
+        assert processor._margin_threshold == 230
+        assert processor._dark_threshold == 40
+
+        default_processor = ImageProcessor()
+        assert default_processor._margin_threshold == 240
+        assert default_processor._dark_threshold == 50
+
     def test_pil_to_cv2(self):
         """PIL ImageからOpenCV形式への変換テスト"""
         # テスト画像を作成
@@ -235,6 +247,84 @@ class TestImageProcessor:
 
         assert isinstance(result, Image.Image)
 
+    def test_process_batch(self, tmp_path):
+        """複数画像のバッチ最適化テスト"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        image_paths = []
+        for i in range(3):
+            image_path = input_dir / f"page_{i:04d}.png"
+            Image.new("RGB", (100, 100), color="white").save(image_path)
+            image_paths.append(image_path)
+        missing_path = input_dir / "missing.png"
+
+        processor = ImageProcessor(
+            enable_noise_removal=False,
+            enable_contrast_adjustment=False,
+            enable_skew_correction=False,
+            enable_binarization=True
+        )
+
+        output_dir = tmp_path / "output"
+        result = processor.process_batch(
+            image_paths + [missing_path], output_dir, max_workers=2
+        )
+
+        assert result["success_count"] == 3
+        assert result["output_files"] == [output_dir / p.name for p in image_paths]
+        assert result["failed_files"] == [missing_path]
+        assert all(p.exists() for p in result["output_files"])
+
+    def test_process_batch_rejects_overwrites(self, tmp_path):
+        """入力の上書きやファイル名の重複が起きる画像は処理しないことのテスト"""
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        first = dir_a / "page_0001.png"
+        duplicate = dir_b / "page_0001.png"
+        Image.new("RGB", (100, 100), color="white").save(first)
+        Image.new("RGB", (100, 100), color="white").save(duplicate)
+
+        processor = ImageProcessor(
+            enable_noise_removal=False,
+            enable_contrast_adjustment=False,
+            enable_skew_correction=False,
+            enable_binarization=False
+        )
+
+        # 異なるディレクトリの同名ファイルは、最初の1枚のみ処理する
+        output_dir = tmp_path / "output"
+        result = processor.process_batch([first, duplicate], output_dir, max_workers=1)
+        assert result["output_files"] == [output_dir / "page_0001.png"]
+        assert result["failed_files"] == [duplicate]
+
+        # 大文字小文字のみが異なるファイル名も重複として扱う
+        upper = dir_b / "PAGE_0001.png"
+        duplicate.rename(upper)
+        result = processor.process_batch([first, upper], tmp_path / "output_case", max_workers=1)
+        assert result["failed_files"] == [upper]
+
+        # 出力先が入力と同じディレクトリの場合は元の画像を上書きしない
+        original_bytes = first.read_bytes()
+        result = processor.process_batch([first], dir_a, max_workers=1)
+        assert result["success_count"] == 0
+        assert result["failed_files"] == [first]
+        assert first.read_bytes() == original_bytes
+
+        # 別の入力画像を上書きする出力も処理しない（失敗は入力順に並ぶ）
+        source_in_output = output_dir / "page_0002.png"
+        Image.new("RGB", (100, 100), color="white").save(source_in_output)
+        other = dir_a / "page_0002.png"
+        Image.new("RGB", (100, 100), color="black").save(other)
+        original_bytes = source_in_output.read_bytes()
+        result = processor.process_batch(
+            [other, source_in_output, first], output_dir, max_workers=1
+        )
+        assert result["output_files"] == [output_dir / "page_0001.png"]
+        assert result["failed_files"] == [other, source_in_output]
+        assert source_in_output.read_bytes() == original_bytes
+
     def test_pil_to_cv2_rgba(self):
         """RGBA画像の変換テスト"""
         pil_image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 128))
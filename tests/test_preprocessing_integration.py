@@ -3,9 +3,7 @@
 設定ファイルから読み込んで、実際のスクリーンショットに対して前処理を実行する
 """
 import pytest
-from pathlib import Path
 from PIL import Image
-import yaml
 
 from src.preprocessor.image_processor import ImageProcessor
 
@@ -13,13 +11,6 @@ from src.preprocessor.image_processor import ImageProcessor
 class TestPreprocessingIntegration:
     """画像前処理の統合テスト"""
 
-    @pytest.fixture
-    def config(self):
-        """設定ファイルを読み込む"""
-        config_path = Path("config/config.yaml")
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-
     @pytest.fixture
     def sample_image(self):
         """テスト用のサンプル画像を作成"""
@@ -28,12 +19,11 @@ class TestPreprocessingIntegration:
         return image
 
     @pytest.fixture
-    def screenshot_image(self):
+    def screenshot_image(self, screenshot_path):
         """実際のスクリーンショットを読み込む（存在する場合）"""
-        screenshot_path = Path("output/LLM自作入門_screenshots/page_0001.png")
-        if screenshot_path.exists():
-            return Image.open(screenshot_path)
-        return None
+        if screenshot_path is None:
+            return None
+        return Image.open(screenshot_path)
 
     def test_image_processor_with_config(self, config):
         """設定辞書でImageProcessorを初期化できることを確認"""
@@ -329,3 +329,31 @@ class TestStateManager:
         assert loaded_state is not None
         assert loaded_state.processed_pages == list(range(1, 50))
         assert loaded_state.failed_pages == [5, 10, 15]
+
+    def test_save_state_compresses_page_ranges(self, state_manager):
+        """ページ番号が連続区間に圧縮されて保存されることのテスト"""
+        now = datetime.now().isoformat()
+        state = StateData(
+            book_title="Range Book",
+            start_datetime=now,
+            last_update=now,
+            current_page=1000,
+            total_pages=1000,
+            processed_pages=list(range(1, 1001)),
+            failed_pages=[5, 6, 10],
+            output_file="output/range.txt",
+            screenshot_dir="output/screenshots_range",
+            status="in_progress",
+        )
+
+        state_manager.save_state(state)
+
+        file_path = state_manager.get_state_file_path("Range Book")
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["processed_pages"] == [[1, 1000]]
+        assert data["failed_pages"] == [[5, 6], [10, 10]]
+
+        loaded_state = state_manager.load_state("Range Book")
+        assert loaded_state.processed_pages == list(range(1, 1001))
+        assert loaded_state.failed_pages == [5, 6, 10]
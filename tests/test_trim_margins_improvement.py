@@ -1,31 +1,32 @@
 """
 改善されたtrim_marginsメソッドのテスト
 """
+import io
 import pytest
 from pathlib import Path
 from PIL import Image
-import yaml
 
 from src.preprocessor.image_processor import ImageProcessor
 
 
-class TestTrimMarginsImprovement:
-    """改善されたtrim_marginsメソッドのテスト"""
+@pytest.fixture(scope="session")
+def screenshot_bytes(screenshot_path):
+    """実際のスクリーンショットのPNGデータを読み込む（セッション中1回のみ）"""
+    if screenshot_path is None:
+        return None
+    return screenshot_path.read_bytes()
+
 
-    @pytest.fixture
-    def config(self):
-        """設定ファイルを読み込む"""
-        config_path = Path("config/config.yaml")
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-
-    @pytest.fixture
-    def screenshot_image(self):
-        """実際のスクリーンショットを読み込む"""
-        screenshot_path = Path("output/LLM自作入門_screenshots/page_0002.png")
-        if screenshot_path.exists():
-            return Image.open(screenshot_path)
+@pytest.fixture
+def screenshot_image(screenshot_bytes):
+    """テストごとに新しいスクリーンショット画像を作成"""
+    if screenshot_bytes is None:
         return None
+    return Image.open(io.BytesIO(screenshot_bytes))
+
+
+class TestTrimMarginsImprovement:
+    """改善されたtrim_marginsメソッドのテスト"""
 
     def test_trim_margins_with_black_borders(self, config, screenshot_image):
         """黒い余白を含むスクリーンショットをトリミング"""
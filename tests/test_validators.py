@@ -1,6 +1,5 @@
 """Unit tests for validators module."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -22,6 +21,20 @@ from src.utils.validators import (
 )
 
 
+@pytest.fixture(scope="module")
+def existing_file(tmp_path_factory):
+    """Shared empty file for read-only existence checks."""
+    path = tmp_path_factory.mktemp("validators") / "existing.txt"
+    path.write_bytes(b"")
+    return path
+
+
+@pytest.fixture(scope="module")
+def existing_dir(tmp_path_factory):
+    """Shared directory for read-only existence checks."""
+    return tmp_path_factory.mktemp("validators_dir")
+
+
 class TestValidateBookTitle:
     """Test cases for validate_book_title."""
 
@@ -88,17 +101,10 @@ class TestValidateFilePath:
         with pytest.raises(ValidationError, match="cannot be empty"):
             validate_file_path("")
 
-    def test_must_exist_true(self):
+    def test_must_exist_true(self, existing_file):
         """Test validation requiring existing file."""
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            temp_path = f.name
-
-        try:
-            path = validate_file_path(temp_path, must_exist=True)
-            assert path.exists()
-        finally:
-            Path(temp_path).unlink()
+        path = validate_file_path(str(existing_file), must_exist=True)
+        assert path.exists()
 
     def test_must_exist_false(self):
         """Test validation not requiring existing file."""
@@ -114,44 +120,36 @@ class TestValidateFilePath:
 class TestValidateDirectoryPath:
     """Test cases for validate_directory_path."""
 
-    def test_valid_directory(self):
+    def test_valid_directory(self, existing_dir):
         """Test validation with valid directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = validate_directory_path(tmpdir)
-            assert path.is_dir()
+        path = validate_directory_path(str(existing_dir))
+        assert path.is_dir()
 
-    def test_create_if_missing(self):
+    def test_create_if_missing(self, tmp_path):
         """Test creating directory if missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            new_dir = Path(tmpdir) / "new_dir"
-            path = validate_directory_path(str(new_dir), create_if_missing=True)
-            assert path.exists()
-            assert path.is_dir()
+        new_dir = tmp_path / "new_dir"
+        path = validate_directory_path(str(new_dir), create_if_missing=True)
+        assert path.exists()
+        assert path.is_dir()
 
     def test_empty_path(self):
         """Test validation with empty path."""
         with pytest.raises(ValidationError, match="cannot be empty"):
             validate_directory_path("")
 
-    def test_path_is_file_not_directory(self):
+    def test_path_is_file_not_directory(self, existing_file):
         """Test validation failing when path is file."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValidationError, match="not a directory"):
-                validate_directory_path(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(ValidationError, match="not a directory"):
+            validate_directory_path(str(existing_file))
 
 
 class TestValidatePageNumber:
     """Test cases for validate_page_number."""
 
-    def test_valid_page_number(self):
+    @pytest.mark.parametrize("page", [1, 100])
+    def test_valid_page_number(self, page):
         """Test validation with valid page number."""
-        assert validate_page_number(1) == 1
-        assert validate_page_number(100) == 100
+        assert validate_page_number(page) == page
 
     def test_page_below_minimum(self):
         """Test validation with page below minimum."""
@@ -193,21 +191,16 @@ class TestValidatePageRange:
 class TestValidateConfidenceThreshold:
     """Test cases for validate_confidence_threshold."""
 
-    def test_valid_threshold(self):
+    @pytest.mark.parametrize("threshold", [0.5, 0.0, 1.0])
+    def test_valid_threshold(self, threshold):
         """Test validation with valid threshold."""
-        assert validate_confidence_threshold(0.5) == 0.5
-        assert validate_confidence_threshold(0.0) == 0.0
-        assert validate_confidence_threshold(1.0) == 1.0
+        assert validate_confidence_threshold(threshold) == threshold
 
-    def test_threshold_below_zero(self):
-        """Test validation with threshold below 0."""
+    @pytest.mark.parametrize("threshold", [-0.1, 1.1])
+    def test_threshold_out_of_range(self, threshold):
+        """Test validation with threshold below 0 or above 1."""
         with pytest.raises(ValidationError, match="between 0.0 and 1.0"):
-            validate_confidence_threshold(-0.1)
-
-    def test_threshold_above_one(self):
-        """Test validation with threshold above 1."""
-        with pytest.raises(ValidationError, match="between 0.0 and 1.0"):
-            validate_confidence_threshold(1.1)
+            validate_confidence_threshold(threshold)
 
     def test_non_numeric_threshold(self):
         """Test validation with non-numeric threshold."""
@@ -264,20 +257,16 @@ class TestValidateLogLevel:
 class TestValidatePositiveInteger:
     """Test cases for validate_positive_integer."""
 
-    def test_valid_positive_integer(self):
+    @pytest.mark.parametrize("value", [1, 100])
+    def test_valid_positive_integer(self, value):
         """Test validation with valid positive integer."""
-        assert validate_positive_integer(1) == 1
-        assert validate_positive_integer(100) == 100
-
-    def test_zero(self):
-        """Test validation with zero."""
-        with pytest.raises(ValidationError, match="must be positive"):
-            validate_positive_integer(0)
+        assert validate_positive_integer(value) == value
 
-    def test_negative(self):
-        """Test validation with negative number."""
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_not_positive(self, value):
+        """Test validation with zero or negative number."""
         with pytest.raises(ValidationError, match="must be positive"):
-            validate_positive_integer(-1)
+            validate_positive_integer(value)
 
     def test_non_integer(self):
         """Test validation with non-integer."""
@@ -288,11 +277,10 @@ class TestValidatePositiveInteger:
 class TestValidateNonNegativeNumber:
     """Test cases for validate_non_negative_number."""
 
-    def test_valid_non_negative(self):
+    @pytest.mark.parametrize("value,expected", [(0, 0.0), (1.5, 1.5), (100, 100.0)])
+    def test_valid_non_negative(self, value, expected):
         """Test validation with valid non-negative number."""
-        assert validate_non_negative_number(0) == 0.0
-        assert validate_non_negative_number(1.5) == 1.5
-        assert validate_non_negative_number(100) == 100.0
+        assert validate_non_negative_number(value) == expected
 
     def test_negative(self):
         """Test validation with negative number."""
@@ -2,8 +2,10 @@
 window_manager.py モジュールのユニットテスト
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from src.capture.window_manager import (
     WindowManager,
     WindowInfo,
@@ -11,6 +13,42 @@ from src.capture.window_manager import (
     find_and_activate_kindle
 )
 
+# 同一性の確認のみに使用するウィンドウハンドル
+_SENTINEL_HANDLE = object()
+
+
+def make_window(title, is_minimized=False):
+    """
+    pygetwindowのWindowオブジェクトの代わりとなるテスト用ウィンドウを作成
+
+    呼び出しを検証する activate / restore のみ Mock とする
+    """
+    return SimpleNamespace(
+        title=title,
+        isMinimized=is_minimized,
+        activate=Mock(),
+        restore=Mock()
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """待機処理で実際にスリープしないようにする"""
+    monkeypatch.setattr('src.capture.window_manager.time.sleep', lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def kindle_window_info():
+    """テストで共通に使用するKindleウィンドウ情報"""
+    # WindowInfo は変更可能なため、テストごとに作成する
+    return WindowInfo(
+        title="Kindle",
+        left=100,
+        top=200,
+        width=800,
+        height=600
+    )
+
 
 class TestWindowInfo:
     """WindowInfoクラスのテスト"""
@@ -31,20 +69,20 @@ class TestWindowInfo:
         assert window_info.width == 800
         assert window_info.height == 600
         assert window_info.handle is None
+        assert not hasattr(window_info, "__dict__")
 
     def test_window_info_with_handle(self):
         """ハンドル付きWindowInfoの作成テスト"""
-        mock_handle = Mock()
         window_info = WindowInfo(
             title="Test Window",
             left=0,
             top=0,
             width=1024,
             height=768,
-            handle=mock_handle
+            handle=_SENTINEL_HANDLE
         )
 
-        assert window_info.handle is mock_handle
+        assert window_info.handle is _SENTINEL_HANDLE
 
 
 class TestRegion:
@@ -58,11 +96,30 @@ class TestRegion:
         assert region.top == 100
         assert region.width == 640
         assert region.height == 480
+        assert not hasattr(region, "__dict__")
 
 
 class TestWindowManager:
     """WindowManagerクラスのテスト"""
 
+    @pytest.fixture
+    def mock_enum_windows(self, mocker):
+        """_enum_windows のモック"""
+        return mocker.patch('src.capture.window_manager._enum_windows')
+
+    @pytest.fixture
+    def mock_get_windows(self, mocker):
+        """gw.getWindowsWithTitle のモック"""
+        mock_gw = mocker.patch('src.capture.window_manager.gw')
+        return mock_gw.getWindowsWithTitle
+
+    @pytest.fixture
+    def mock_win32gui(self, mocker):
+        """activate_window が遅延インポートする win32gui / win32con のモック"""
+        mock_win32gui = Mock()
+        mocker.patch.dict('sys.modules', {'win32gui': mock_win32gui, 'win32con': Mock()})
+        return mock_win32gui
+
     def test_init_default(self):
         """デフォルト設定での初期化テスト"""
         manager = WindowManager()
@@ -74,196 +131,137 @@ class TestWindowManager:
         manager = WindowManager(window_title_pattern=pattern)
         assert manager.window_title_pattern == pattern
 
-    @patch('src.capture.window_manager.gw.getAllWindows')
-    def test_find_kindle_window_success(self, mock_get_all_windows):
-        """Kindleウィンドウの検出成功テスト"""
-        # モックウィンドウを作成
-        mock_window = Mock()
-        mock_window.title = "Kindle for PC - Book Title"
-        mock_window.left = 100
-        mock_window.top = 200
-        mock_window.width = 800
-        mock_window.height = 600
-
-        mock_get_all_windows.return_value = [mock_window]
-
-        manager = WindowManager()
-        result = manager.find_kindle_window()
-
-        assert result is not None
-        assert result.title == "Kindle for PC - Book Title"
-        assert result.left == 100
-        assert result.top == 200
-        assert result.width == 800
-        assert result.height == 600
-
-    @patch('src.capture.window_manager.gw.getAllWindows')
-    def test_find_kindle_window_not_found(self, mock_get_all_windows):
-        """Kindleウィンドウが見つからない場合のテスト"""
-        mock_window = Mock()
-        mock_window.title = "Other Application"
-
-        mock_get_all_windows.return_value = [mock_window]
-
-        manager = WindowManager()
-        result = manager.find_kindle_window()
-
-        assert result is None
-
-    @patch('src.capture.window_manager.gw.getAllWindows')
-    def test_find_kindle_window_with_custom_pattern(self, mock_get_all_windows):
-        """カスタムパターンでのウィンドウ検出テスト"""
-        mock_window = Mock()
-        mock_window.title = "My Custom App"
-        mock_window.left = 0
-        mock_window.top = 0
-        mock_window.width = 1024
-        mock_window.height = 768
+    def test_all_windows_cached(self, mock_enum_windows):
+        """ウィンドウ一覧がTTL内はキャッシュされることのテスト"""
+        mock_enum_windows.return_value = []
+
+        manager = WindowManager(cache_ttl=60)
+        manager.find_kindle_window()
+        manager.list_all_windows()
+        assert mock_enum_windows.call_count == 1
+
+        manager = WindowManager(cache_ttl=0)
+        manager.find_kindle_window()
+        manager.list_all_windows()
+        assert mock_enum_windows.call_count == 3
+
+        # キャッシュはインスタンスごとに保持され、他のインスタンスとは共有しない
+        manager = WindowManager(cache_ttl=60)
+        manager.list_all_windows()
+        assert mock_enum_windows.call_count == 4
+
+    @pytest.mark.parametrize("pattern,title,expected", [
+        (None, "Kindle for PC - Book Title", True),   # デフォルトキーワードで検出
+        (None, "Other Application", False),           # 見つからない
+        ("Custom App", "My Custom App", True),        # カスタムパターンで検出
+        ("kindle (pc)", "Kindle (PC) - Book", True),  # 正規表現ではなく文字列として照合
+    ])
+    def test_find_kindle_window(self, mock_enum_windows, pattern, title, expected):
+        """Kindleウィンドウの検出テスト"""
+        # 列挙されるウィンドウを設定
+        mock_enum_windows.return_value = [WindowInfo(title, 100, 200, 800, 600)]
 
-        mock_get_all_windows.return_value = [mock_window]
-
-        manager = WindowManager(window_title_pattern="Custom App")
+        manager = WindowManager(window_title_pattern=pattern)
         result = manager.find_kindle_window()
 
-        assert result is not None
-        assert result.title == "My Custom App"
+        assert (result is not None) == expected
+        if expected:
+            assert result.title == title
+            assert result.left == 100
+            assert result.top == 200
+            assert result.width == 800
+            assert result.height == 600
 
-    @patch('src.capture.window_manager.gw.getAllWindows')
-    def test_find_kindle_window_error(self, mock_get_all_windows):
+    def test_find_kindle_window_error(self, mock_enum_windows):
         """ウィンドウ検出エラーのテスト"""
-        mock_get_all_windows.side_effect = Exception("Test error")
+        mock_enum_windows.side_effect = Exception("Test error")
 
         manager = WindowManager()
 
-        with pytest.raises(RuntimeError, match="Error while searching for Kindle window"):
+        with pytest.raises(RuntimeError) as excinfo:
             manager.find_kindle_window()
-
-    @patch('src.capture.window_manager.gw.getWindowsWithTitle')
-    @patch('src.capture.window_manager.time.sleep')
-    def test_activate_window_success(self, mock_sleep, mock_get_windows):
-        """ウィンドウアクティブ化成功テスト"""
-        # モックウィンドウを作成
-        mock_window = Mock()
-        mock_window.isMinimized = False
-        mock_window.activate = Mock()
-
+        assert "Error while searching for Kindle window" in str(excinfo.value)
+
+    @pytest.mark.parametrize(
+        "find_hwnd,foreground_hwnd,minimized,side_effect,expected,expect_restore",
+        [
+            (1234, 1234, False, None, True, False),
+            (1234, 1234, True, None, True, True),
+            (0, 0, False, None, False, False),
+            (1234, 0, False, Exception("Test error"), False, False),
+            (1234, 1234, False, Exception("Test error"), True, False),
+        ],
+        ids=["normal", "minimized", "not_found", "error", "error_win32_fallback"]
+    )
+    def test_activate_window(
+        self,
+        mock_get_windows,
+        mock_win32gui,
+        kindle_window_info,
+        find_hwnd,
+        foreground_hwnd,
+        minimized,
+        side_effect,
+        expected,
+        expect_restore
+    ):
+        """ウィンドウアクティブ化テスト（通常・最小化・未検出・エラー）"""
+        mock_win32gui.FindWindow.return_value = find_hwnd
+        mock_win32gui.GetForegroundWindow.return_value = foreground_hwnd
+        mock_window = make_window("Kindle", is_minimized=minimized)
         mock_get_windows.return_value = [mock_window]
-
-        window_info = WindowInfo(
-            title="Kindle",
-            left=100,
-            top=200,
-            width=800,
-            height=600
-        )
+        mock_get_windows.side_effect = side_effect
 
         manager = WindowManager()
-        result = manager.activate_window(window_info)
-
-        assert result is True
-        mock_window.activate.assert_called_once()
-
-    @patch('src.capture.window_manager.gw.getWindowsWithTitle')
-    @patch('src.capture.window_manager.time.sleep')
-    def test_activate_window_from_minimized(self, mock_sleep, mock_get_windows):
-        """最小化されたウィンドウのアクティブ化テスト"""
-        mock_window = Mock()
-        mock_window.isMinimized = True
-        mock_window.restore = Mock()
-        mock_window.activate = Mock()
-
-        mock_get_windows.return_value = [mock_window]
+        result = manager.activate_window(kindle_window_info)
+
+        assert result is expected
+        # ハンドルが見つからない場合は pygetwindow による検索を行わない
+        assert mock_get_windows.called == bool(find_hwnd)
+        assert mock_window.restore.called == expect_restore
+        if expected and side_effect is None:
+            mock_window.activate.assert_called_once()
+        if not expected and find_hwnd:
+            # 検証に失敗した場合はリトライする
+            assert mock_get_windows.call_count == 3
+
+    def test_activate_window_with_handle(self, mock_get_windows, mock_win32gui):
+        """ハンドル付きWindowInfoではタイトルによる再検索を行わないことのテスト"""
+        mock_win32gui.GetForegroundWindow.return_value = 1234
 
         window_info = WindowInfo(
             title="Kindle",
             left=100,
             top=200,
             width=800,
-            height=600
+            height=600,
+            handle=1234
         )
 
         manager = WindowManager()
         result = manager.activate_window(window_info)
 
         assert result is True
-        mock_window.restore.assert_called_once()
-        mock_window.activate.assert_called_once()
-
-    @patch('src.capture.window_manager.gw.getWindowsWithTitle')
-    def test_activate_window_not_found(self, mock_get_windows):
-        """ウィンドウが見つからない場合のアクティブ化テスト"""
-        mock_get_windows.return_value = []
+        mock_win32gui.FindWindow.assert_not_called()
+        mock_get_windows.assert_not_called()
 
-        window_info = WindowInfo(
-            title="Non-existent Window",
-            left=0,
-            top=0,
-            width=800,
-            height=600
-        )
-
-        manager = WindowManager()
-        result = manager.activate_window(window_info)
-
-        assert result is False
-
-    @patch('src.capture.window_manager.gw.getWindowsWithTitle')
-    def test_activate_window_error(self, mock_get_windows):
-        """ウィンドウアクティブ化エラーのテスト"""
-        mock_get_windows.side_effect = Exception("Test error")
-
-        window_info = WindowInfo(
-            title="Kindle",
-            left=100,
-            top=200,
-            width=800,
-            height=600
-        )
-
-        manager = WindowManager()
-        result = manager.activate_window(window_info)
-
-        assert result is False
-
-    def test_get_window_region(self):
+    def test_get_window_region(self, kindle_window_info):
         """ウィンドウ領域取得テスト"""
-        window_info = WindowInfo(
-            title="Kindle",
-            left=100,
-            top=200,
-            width=800,
-            height=600
-        )
-
         manager = WindowManager()
-        region = manager.get_window_region(window_info)
+        region = manager.get_window_region(kindle_window_info)
 
         assert region.left == 100
         assert region.top == 200
         assert region.width == 800
         assert region.height == 600
 
-    @patch('src.capture.window_manager.gw.getAllWindows')
-    def test_list_all_windows(self, mock_get_all_windows):
+    def test_list_all_windows(self, mock_enum_windows):
         """全ウィンドウリスト取得テスト"""
-        mock_window1 = Mock()
-        mock_window1.title = "Window 1"
-        mock_window1.left = 0
-        mock_window1.top = 0
-        mock_window1.width = 800
-        mock_window1.height = 600
-
-        mock_window2 = Mock()
-        mock_window2.title = "Window 2"
-        mock_window2.left = 100
-        mock_window2.top = 100
-        mock_window2.width = 1024
-        mock_window2.height = 768
-
-        mock_window3 = Mock()
-        mock_window3.title = ""  # 空のタイトル
-
-        mock_get_all_windows.return_value = [mock_window1, mock_window2, mock_window3]
+        mock_enum_windows.return_value = [
+            WindowInfo("Window 1", 0, 0, 800, 600),
+            WindowInfo("Window 2", 100, 100, 1024, 768),
+            WindowInfo("", 0, 0, 0, 0),  # 空のタイトル
+        ]
 
         manager = WindowManager()
         windows = manager.list_all_windows()
@@ -272,10 +270,9 @@ class TestWindowManager:
         assert windows[0].title == "Window 1"
         assert windows[1].title == "Window 2"
 
-    @patch('src.capture.window_manager.gw.getAllWindows')
-    def test_list_all_windows_error(self, mock_get_all_windows):
+    def test_list_all_windows_error(self, mock_enum_windows):
         """ウィンドウリスト取得エラーのテスト"""
-        mock_get_all_windows.side_effect = Exception("Test error")
+        mock_enum_windows.side_effect = Exception("Test error")
 
         manager = WindowManager()
         windows = manager.list_all_windows()
@@ -286,23 +283,19 @@ class TestWindowManager:
 class TestHelperFunctions:
     """ヘルパー関数のテスト"""
 
-    @patch('src.capture.window_manager.WindowManager.find_kindle_window')
-    @patch('src.capture.window_manager.WindowManager.activate_window')
-    def test_find_and_activate_kindle_success(
-        self,
-        mock_activate,
-        mock_find
-    ):
-        """Kindle検出とアクティブ化成功テスト"""
-        mock_window_info = WindowInfo(
-            title="Kindle",
-            left=100,
-            top=200,
-            width=800,
-            height=600
-        )
+    @pytest.fixture
+    def mock_find(self, mocker):
+        """WindowManager.find_kindle_window のモック（シグネチャ検証付き）"""
+        return mocker.patch.object(WindowManager, "find_kindle_window", autospec=True)
 
-        mock_find.return_value = mock_window_info
+    @pytest.fixture
+    def mock_activate(self, mocker):
+        """WindowManager.activate_window のモック（シグネチャ検証付き）"""
+        return mocker.patch.object(WindowManager, "activate_window", autospec=True)
+
+    def test_find_and_activate_kindle_success(self, mock_find, mock_activate, kindle_window_info):
+        """Kindle検出とアクティブ化成功テスト"""
+        mock_find.return_value = kindle_window_info
         mock_activate.return_value = True
 
         result = find_and_activate_kindle()
@@ -310,32 +303,23 @@ class TestHelperFunctions:
         assert result is not None
         assert result.title == "Kindle"
 
-    @patch('src.capture.window_manager.WindowManager.find_kindle_window')
-    def test_find_and_activate_kindle_not_found(self, mock_find):
+    def test_find_and_activate_kindle_not_found(self, mock_find, mock_activate):
         """Kindleが見つからない場合のテスト"""
         mock_find.return_value = None
 
         result = find_and_activate_kindle()
 
         assert result is None
+        mock_activate.assert_not_called()
 
-    @patch('src.capture.window_manager.WindowManager.find_kindle_window')
-    @patch('src.capture.window_manager.WindowManager.activate_window')
     def test_find_and_activate_kindle_activation_failed(
         self,
+        mock_find,
         mock_activate,
-        mock_find
+        kindle_window_info
     ):
         """アクティブ化失敗のテスト"""
-        mock_window_info = WindowInfo(
-            title="Kindle",
-            left=100,
-            top=200,
-            width=800,
-            height=600
-        )
-
-        mock_find.return_value = mock_window_info
+        mock_find.return_value = kindle_window_info
         mock_activate.return_value = False
 
         result = find_and_activate_kindle()